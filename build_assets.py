@@ -0,0 +1,315 @@
+"""
+前端靜態資源建置：python build_assets.py
+
+掃描 templates/*.html 實際用到的 Tailwind class 與 icon() 圖示，產生
+  static/dist/app.<hash>.css     只含用到的 utility（已壓縮）
+  static/dist/icons.<hash>.svg   Feather 圖示 sprite（<symbol>），頁面以 <use> 引用
+  static/dist/manifest.json      原始檔名 -> 帶雜湊檔名，由 app.py 的 asset_url() 讀取
+檔名含內容雜湊，可設定長期快取；修改模板後重新執行即可。
+不需要 Node / CDN，校內網路或離線環境也能使用。
+"""
+import glob, hashlib, json, os, re, sys
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES = os.path.join(BASE, 'templates')
+DIST = os.path.join(BASE, 'static', 'dist')
+
+# ===== Tailwind 設定（與原本 layout.html 的 tailwind.config 相同） =====
+PALETTE = {
+    'slate':   ['#f8fafc', '#f1f5f9', '#e2e8f0', '#cbd5e1', '#94a3b8', '#64748b', '#475569', '#334155', '#1e293b', '#0f172a'],
+    'gray':    ['#f9fafb', '#f3f4f6', '#e5e7eb', '#d1d5db', '#9ca3af', '#6b7280', '#4b5563', '#374151', '#1f2937', '#111827'],
+    'red':     ['#fef2f2', '#fee2e2', '#fecaca', '#fca5a5', '#f87171', '#ef4444', '#dc2626', '#b91c1c', '#991b1b', '#7f1d1d'],
+    'amber':   ['#fffbeb', '#fef3c7', '#fde68a', '#fcd34d', '#fbbf24', '#f59e0b', '#d97706', '#b45309', '#92400e', '#78350f'],
+    'green':   ['#f0fdf4', '#dcfce7', '#bbf7d0', '#86efac', '#4ade80', '#22c55e', '#16a34a', '#15803d', '#166534', '#14532d'],
+    'emerald': ['#ecfdf5', '#d1fae5', '#a7f3d0', '#6ee7b7', '#34d399', '#10b981', '#059669', '#047857', '#065f46', '#064e3b'],
+    'sky':     ['#f0f9ff', '#e0f2fe', '#bae6fd', '#7dd3fc', '#38bdf8', '#0ea5e9', '#0284c7', '#0369a1', '#075985', '#0c4a6e'],
+    'blue':    ['#eff6ff', '#dbeafe', '#bfdbfe', '#93c5fd', '#60a5fa', '#3b82f6', '#2563eb', '#1d4ed8', '#1e40af', '#1e3a8a'],
+    'indigo':  ['#eef2ff', '#e0e7ff', '#c7d2fe', '#a5b4fc', '#818cf8', '#6366f1', '#4f46e5', '#4338ca', '#3730a3', '#312e81'],
+    'rose':    ['#fff1f2', '#ffe4e6', '#fecdd3', '#fda4af', '#fb7185', '#f43f5e', '#e11d48', '#be123c', '#9f1239', '#881337'],
+}
+COLORS = {'white': '#ffffff', 'black': '#000000', 'primary': '#0C4A6E', 'secondary': '#0369A1'}
+for _name, _shades in PALETTE.items():
+    for _i, _hex in enumerate(_shades):
+        COLORS[f'{_name}-{50 if _i == 0 else _i * 100}'] = _hex
+
+SCREENS = {'sm': 640, 'md': 768, 'lg': 1024, 'xl': 1280}
+PSEUDO = {'hover': ':hover', 'focus': ':focus'}
+
+SPACING_KEYS = ['0', 'px', '0.5', '1', '1.5', '2', '2.5', '3', '3.5', '4', '5', '6', '7', '8', '9', '10', '11', '12',
+                '14', '16', '20', '24', '28', '32', '36', '40', '44', '48', '52', '56', '60', '64', '72', '80', '96']
+FONT_SIZES = {'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+              'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+              '3xl': ('1.875rem', '2.25rem')}
+FONT_WEIGHTS = {'normal': 400, 'medium': 500, 'semibold': 600, 'bold': 700}
+RADII = {'': '0.25rem', 'sm': '0.125rem', 'md': '0.375rem', 'lg': '0.5rem', 'xl': '0.75rem', '2xl': '1rem',
+         '3xl': '1.5rem', 'full': '9999px', 'none': '0px'}
+SHADOWS = {'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+           '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+           'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+           'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+           'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+           'none': '0 0 #0000'}
+MAX_WIDTHS = {'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem', '2xl': '42rem',
+              '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem', 'full': '100%', 'none': 'none'}
+DISPLAYS = {'block': 'block', 'inline-block': 'inline-block', 'inline': 'inline', 'flex': 'flex',
+            'inline-flex': 'inline-flex', 'grid': 'grid', 'table': 'table', 'contents': 'contents', 'hidden': 'none'}
+GRADIENT_DIRS = {'t': 'top', 'tr': 'top right', 'r': 'right', 'br': 'bottom right', 'b': 'bottom',
+                 'bl': 'bottom left', 'l': 'left', 'tl': 'top left'}
+
+PREFLIGHT = '''*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}
+html{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;font-family:ui-sans-serif,system-ui,-apple-system,"Segoe UI",Roboto,"Helvetica Neue",Arial,"Noto Sans TC","PingFang TC","Microsoft JhengHei",sans-serif}
+body{margin:0;line-height:inherit}
+hr{height:0;color:inherit;border-top-width:1px}
+h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}
+a{color:inherit;text-decoration:inherit}
+b,strong{font-weight:bolder}
+small{font-size:80%}
+table{text-indent:0;border-color:inherit;border-collapse:collapse}
+button,input,optgroup,select,textarea{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;color:inherit;margin:0;padding:0}
+button,select{text-transform:none}
+button,[type=button],[type=reset],[type=submit]{-webkit-appearance:button;background-color:transparent;background-image:none}
+:-moz-focusring{outline:auto}
+summary{display:list-item}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}
+fieldset{margin:0;padding:0}
+legend{padding:0}
+ol,ul,menu{list-style:none;margin:0;padding:0}
+textarea{resize:vertical}
+input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}
+button,[role=button]{cursor:pointer}
+:disabled{cursor:default}
+img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}
+img,video{max-width:100%;height:auto}
+[hidden]{display:none}
+.feather{display:inline-block;width:24px;height:24px;flex-shrink:0}'''
+
+# ===== Feather 圖示（MIT License, https://feathericons.com），只會輸出模板用到的 =====
+ICONS = {
+    'activity': '<polyline points="22 12 18 12 15 21 9 3 6 12 2 12"/>',
+    'alert-triangle': '<path d="M10.29 3.86L1.82 18a2 2 0 0 0 1.71 3h16.94a2 2 0 0 0 1.71-3L13.71 3.86a2 2 0 0 0-3.42 0z"/><line x1="12" y1="9" x2="12" y2="13"/><line x1="12" y1="17" x2="12.01" y2="17"/>',
+    'bar-chart-2': '<line x1="18" y1="20" x2="18" y2="10"/><line x1="12" y1="20" x2="12" y2="4"/><line x1="6" y1="20" x2="6" y2="14"/>',
+    'check-circle': '<path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/>',
+    'check-square': '<polyline points="9 11 12 14 22 4"/><path d="M21 12v7a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h11"/>',
+    'dollar-sign': '<line x1="12" y1="1" x2="12" y2="23"/><path d="M17 5H9.5a3.5 3.5 0 0 0 0 7h5a3.5 3.5 0 0 1 0 7H6"/>',
+    'download': '<path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"/><polyline points="7 10 12 15 17 10"/><line x1="12" y1="15" x2="12" y2="3"/>',
+    'edit-3': '<path d="M12 20h9"/><path d="M16.5 3.5a2.121 2.121 0 0 1 3 3L7 19l-4 1 1-4L16.5 3.5z"/>',
+    'file-plus': '<path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"/><polyline points="14 2 14 8 20 8"/><line x1="12" y1="18" x2="12" y2="12"/><line x1="9" y1="15" x2="15" y2="15"/>',
+    'file-text': '<path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"/><polyline points="14 2 14 8 20 8"/><line x1="16" y1="13" x2="8" y2="13"/><line x1="16" y1="17" x2="8" y2="17"/><polyline points="10 9 9 9 8 9"/>',
+    'image': '<rect x="3" y="3" width="18" height="18" rx="2" ry="2"/><circle cx="8.5" cy="8.5" r="1.5"/><polyline points="21 15 16 10 5 21"/>',
+    'key': '<path d="M21 2l-2 2m-7.61 7.61a5.5 5.5 0 1 1-7.778 7.778 5.5 5.5 0 0 1 7.777-7.777zm0 0L15.5 7.5m0 0l3 3L22 7l-3-3m-3.5 3.5L19 4"/>',
+    'layers': '<polygon points="12 2 2 7 12 12 22 7 12 2"/><polyline points="2 17 12 22 22 17"/><polyline points="2 12 12 17 22 12"/>',
+    'log-in': '<path d="M15 3h4a2 2 0 0 1 2 2v14a2 2 0 0 1-2 2h-4"/><polyline points="10 17 15 12 10 7"/><line x1="15" y1="12" x2="3" y2="12"/>',
+    'log-out': '<path d="M9 21H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h4"/><polyline points="16 17 21 12 16 7"/><line x1="21" y1="12" x2="9" y2="12"/>',
+    'plus': '<line x1="12" y1="5" x2="12" y2="19"/><line x1="5" y1="12" x2="19" y2="12"/>',
+    'refresh-cw': '<polyline points="23 4 23 10 17 10"/><polyline points="1 20 1 14 7 14"/><path d="M3.51 9a9 9 0 0 1 14.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0 0 20.49 15"/>',
+    'send': '<line x1="22" y1="2" x2="11" y2="13"/><polygon points="22 2 15 22 11 13 2 9 22 2"/>',
+    'trash-2': '<polyline points="3 6 5 6 21 6"/><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/><line x1="10" y1="11" x2="10" y2="17"/><line x1="14" y1="11" x2="14" y2="17"/>',
+    'upload': '<path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"/><polyline points="17 8 12 3 7 8"/><line x1="12" y1="3" x2="12" y2="15"/>',
+    'user-plus': '<path d="M16 21v-2a4 4 0 0 0-4-4H5a4 4 0 0 0-4 4v2"/><circle cx="8.5" cy="7" r="4"/><line x1="20" y1="8" x2="20" y2="14"/><line x1="23" y1="11" x2="17" y2="11"/>',
+    'x': '<line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>',
+}
+
+
+# ===== utility 解析 =====
+def spacing(v):
+    if v == 'px':
+        return '1px'
+    if v in SPACING_KEYS:
+        return '0px' if v == '0' else f'{float(v) * 0.25:g}rem'
+    return None
+
+def size(v):
+    if v == 'full':
+        return '100%'
+    if v == 'auto':
+        return 'auto'
+    m = re.fullmatch(r'(\d+)/(\d+)', v)
+    if m:
+        return f'{int(m.group(1)) / int(m.group(2)) * 100:g}%'
+    m = re.fullmatch(r'\[([^\]]+)\]', v)
+    if m:
+        return m.group(1)
+    return spacing(v)
+
+def color(v):
+    """primary、slate-200、white/20 -> CSS 顏色"""
+    name, _, alpha = v.partition('/')
+    hexv = COLORS.get(name)
+    if not hexv:
+        return None
+    if not alpha:
+        return hexv
+    if not alpha.isdigit():
+        return None
+    r, g, b = (int(hexv[i:i + 2], 16) for i in (1, 3, 5))
+    return f'rgb({r} {g} {b} / {int(alpha) / 100:g})'
+
+def gradient_from(v):
+    c = color(v)
+    if not c:
+        return None
+    name = v.partition('/')[0]
+    r, g, b = (int(COLORS[name][i:i + 2], 16) for i in (1, 3, 5))
+    return (f'--tw-gradient-from:{c};--tw-gradient-to:rgb({r} {g} {b} / 0);'
+            '--tw-gradient-stops:var(--tw-gradient-from),var(--tw-gradient-to)')
+
+def box(prop, sides):
+    """p / px / pt ... -> 宣告產生器"""
+    def make(v):
+        val = spacing(v) if v != 'auto' else 'auto'
+        if not val:
+            return None
+        return ';'.join(f'{prop}{s}:{val}' for s in sides)
+    return make
+
+def between(axis):
+    def make(v):
+        val = spacing(v)
+        return val and (f'margin-left:{val}' if axis == 'x' else f'margin-top:{val}')
+    return make
+
+# 依 Tailwind 的 utility 順序排列，確保後者可覆蓋前者（例如 p-4 之後的 px-2）
+RULES = [
+    (r'col-span-(\d+)', lambda n: f'grid-column:span {n} / span {n}'),
+    (r'm-(.+)', box('margin', [''])),
+    (r'mx-(.+)', box('margin', ['-left', '-right'])),
+    (r'my-(.+)', box('margin', ['-top', '-bottom'])),
+    (r'mt-(.+)', box('margin', ['-top'])),
+    (r'mr-(.+)', box('margin', ['-right'])),
+    (r'mb-(.+)', box('margin', ['-bottom'])),
+    (r'ml-(.+)', box('margin', ['-left'])),
+    (r'(block|inline-block|inline|flex|inline-flex|grid|table|contents|hidden)', lambda v: f'display:{DISPLAYS[v]}'),
+    (r'h-(.+)', lambda v: size(v) and f'height:{size(v)}'),
+    (r'min-h-(.+)', lambda v: {'screen': 'min-height:100vh', 'full': 'min-height:100%'}.get(v) or (size(v) if v.startswith('[') else None) and f'min-height:{size(v)}'),
+    (r'w-(.+)', lambda v: ('width:100vw' if v == 'screen' else size(v) and f'width:{size(v)}')),
+    (r'min-w-(.+)', lambda v: {'full': 'min-width:100%', '0': 'min-width:0px'}.get(v)),
+    (r'max-w-(.+)', lambda v: v in MAX_WIDTHS and f'max-width:{MAX_WIDTHS[v]}'),
+    (r'flex-1', lambda: 'flex:1 1 0%'),
+    (r'shrink-0', lambda: 'flex-shrink:0'),
+    (r'list-(disc|decimal|none)', lambda v: f'list-style-type:{v}'),
+    (r'grid-cols-(\d+)', lambda n: f'grid-template-columns:repeat({n}, minmax(0, 1fr))'),
+    (r'flex-(col|row|wrap)', lambda v: 'flex-wrap:wrap' if v == 'wrap' else f'flex-direction:{"column" if v == "col" else "row"}'),
+    (r'place-items-(center|start|end)', lambda v: f'place-items:{v}'),
+    (r'items-(center|start|end|stretch|baseline)', lambda v: f'align-items:{ {"start": "flex-start", "end": "flex-end"}.get(v, v)}'),
+    (r'justify-(between|center|start|end|around)', lambda v: f'justify-content:{ {"between": "space-between", "around": "space-around", "start": "flex-start", "end": "flex-end"}.get(v, v)}'),
+    (r'gap-(.+)', lambda v: spacing(v) and f'gap:{spacing(v)}'),
+    (r'space-x-(.+)', between('x')),
+    (r'space-y-(.+)', between('y')),
+    (r'overflow-(x|y)-(auto|hidden|scroll)', lambda a, v: f'overflow-{a}:{v}'),
+    (r'overflow-(auto|hidden)', lambda v: f'overflow:{v}'),
+    (r'truncate', lambda: 'overflow:hidden;text-overflow:ellipsis;white-space:nowrap'),
+    (r'whitespace-(normal|nowrap|pre|pre-line|pre-wrap)', lambda v: f'white-space:{v}'),
+    (r'break-all', lambda: 'word-break:break-all'),
+    (r'rounded(?:-(.+))?', lambda v: (v or '') in RADII and f'border-radius:{RADII[v or ""]}'),
+    (r'border(?:-(\d))?', lambda n: f'border-width:{n or 1}px'),
+    (r'border-(t|b|l|r)(?:-(\d))?', lambda s, n: f'border-{ {"t": "top", "b": "bottom", "l": "left", "r": "right"}[s]}-width:{n or 1}px'),
+    (r'border-(.+)', lambda v: color(v) and f'border-color:{color(v)}'),
+    (r'bg-(.+)', lambda v: color(v) and f'background-color:{color(v)}'),
+    (r'bg-gradient-to-(t|tr|r|br|b|bl|l|tl)', lambda d: f'background-image:linear-gradient(to {GRADIENT_DIRS[d]}, var(--tw-gradient-stops))'),
+    (r'from-(.+)', gradient_from),
+    (r'to-(.+)', lambda v: color(v) and f'--tw-gradient-to:{color(v)}'),
+    (r'object-(cover|contain)', lambda v: f'object-fit:{v}'),
+    (r'p-(.+)', box('padding', [''])),
+    (r'px-(.+)', box('padding', ['-left', '-right'])),
+    (r'py-(.+)', box('padding', ['-top', '-bottom'])),
+    (r'pt-(.+)', box('padding', ['-top'])),
+    (r'pr-(.+)', box('padding', ['-right'])),
+    (r'pb-(.+)', box('padding', ['-bottom'])),
+    (r'pl-(.+)', box('padding', ['-left'])),
+    (r'text-(left|center|right)', lambda v: f'text-align:{v}'),
+    (r'text-(xs|sm|base|lg|xl|2xl|3xl)', lambda v: f'font-size:{FONT_SIZES[v][0]};line-height:{FONT_SIZES[v][1]}'),
+    (r'font-(normal|medium|semibold|bold)', lambda v: f'font-weight:{FONT_WEIGHTS[v]}'),
+    (r'font-mono', lambda: 'font-family:ui-monospace,SFMono-Regular,Menlo,Consolas,monospace'),
+    (r'text-(.+)', lambda v: color(v) and f'color:{color(v)}'),
+    (r'underline', lambda: 'text-decoration-line:underline'),
+    (r'opacity-(\d+)', lambda n: f'opacity:{int(n) / 100:g}'),
+    (r'shadow(?:-(.+))?', lambda v: (v or '') in SHADOWS and f'box-shadow:{SHADOWS[v or ""]}'),
+    (r'outline-none', lambda: 'outline:2px solid transparent;outline-offset:2px'),
+    (r'backdrop-blur', lambda: 'backdrop-filter:blur(8px)'),
+    (r'transition', lambda: 'transition-property:color,background-color,border-color,text-decoration-color,fill,stroke,opacity,box-shadow,transform,filter,backdrop-filter;transition-timing-function:cubic-bezier(0.4,0,0.2,1);transition-duration:150ms'),
+]
+
+def resolve(utility):
+    """回傳 (順序, 宣告) 或 None（不是已知的 utility）"""
+    for order, (pattern, fn) in enumerate(RULES):
+        m = re.fullmatch(pattern, utility)
+        if m:
+            decl = fn(*m.groups())
+            if decl:
+                return order, decl
+    return None
+
+def escape(cls):
+    return re.sub(r'([:/.\[\]%])', r'\\\1', cls)
+
+def build_rule(cls):
+    """含變體（hover: / md: ...）的 class -> (排序鍵, CSS 規則)"""
+    *variants, utility = cls.split(':')
+    screen, pseudo = None, ''
+    for v in variants:
+        if v in SCREENS and screen is None:
+            screen = v
+        elif v in PSEUDO and not pseudo:
+            pseudo = PSEUDO[v]
+        else:
+            return None
+    res = resolve(utility)
+    if not res:
+        return None
+    order, decl = res
+    selector = f'.{escape(cls)}{pseudo}'
+    if utility.startswith('space-'):
+        selector += ' > :not([hidden]) ~ :not([hidden])'
+    rule = f'{selector}{{{decl}}}'
+    if screen:
+        rule = f'@media (min-width:{SCREENS[screen]}px){{{rule}}}'
+    return (SCREENS.get(screen, 0), 1 if pseudo else 0, order, cls), rule
+
+def scan_templates():
+    classes, icons = set(), set()
+    for path in sorted(glob.glob(os.path.join(TEMPLATES, '*.html'))):
+        text = open(path, encoding='utf-8').read()
+        # 與 Tailwind 相同：抓所有可能是 class 的字串，無法解析的自然略過
+        classes.update(re.findall(r'[A-Za-z0-9_:/.\[\]%-]+', text))
+        icons.update(re.findall(r"icon\(\s*['\"]([a-z0-9-]+)['\"]", text))
+    return classes, icons
+
+def build_css(classes):
+    rules = sorted(r for r in (build_rule(c) for c in classes) if r)
+    return PREFLIGHT.replace('\n', '') + ''.join(rule for _, rule in rules) + '\n', len(rules)
+
+def build_sprite(icons):
+    unknown = sorted(icons - set(ICONS))
+    if unknown:
+        sys.exit(f'未知的圖示：{", ".join(unknown)}（請在 build_assets.py 的 ICONS 補上）')
+    symbols = ''.join(f'<symbol id="{name}" viewBox="0 0 24 24">{ICONS[name]}</symbol>' for name in sorted(icons))
+    return f'<svg xmlns="http://www.w3.org/2000/svg">{symbols}</svg>\n'
+
+def write_hashed(name, content):
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+    fname = f'{stem}.{digest}{ext}'
+    with open(os.path.join(DIST, fname), 'w', encoding='utf-8') as f:
+        f.write(content)
+    # 移除舊版本
+    for old in glob.glob(os.path.join(DIST, f'{stem}.*{ext}')):
+        if os.path.basename(old) != fname:
+            os.remove(old)
+    return fname
+
+def main():
+    os.makedirs(DIST, exist_ok=True)
+    classes, icons = scan_templates()
+    css, n_rules = build_css(classes)
+    manifest = {
+        'app.css': 'dist/' + write_hashed('app.css', css),
+        'icons.svg': 'dist/' + write_hashed('icons.svg', build_sprite(icons)),
+    }
+    with open(os.path.join(DIST, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    print(f"{manifest['app.css']}：{n_rules} 條 utility，{len(css) / 1024:.1f} KB")
+    print(f"{manifest['icons.svg']}：{len(icons)} 個圖示")
+
+if __name__ == '__main__':
+    main()
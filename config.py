@@ -4,3 +4,97 @@ SMTP_PORT = 587
 SMTP_USER = "no-reply@example.com"
 SMTP_PASS = "your-password"
 SMTP_SENDER = "經費申請系統 <no-reply@example.com>"
+
+# 密碼雜湊（可用 flask bench-hash 依登入尖峰量測合適的成本參數）
+PASSWORD_HASHER = "scrypt"      # scrypt 或 pbkdf2_sha256
+SCRYPT_N = 2**14
+PBKDF2_ITERATIONS = 600000
+HASH_WORKERS = 2                # 雜湊執行緒數，建議不超過 CPU 核心數
+
+# 伺服器端 session：sqlite（多程序共用）或 memory（單程序 LRU）
+SESSION_BACKEND = "sqlite"
+SESSION_LIFETIME = 8 * 3600
+
+# 頁面快取（儀表板、申請檢視、核銷審核頁），統計見 /admin/cache_stats
+RENDER_CACHE_ENABLED = True
+RENDER_CACHE_MAX_ENTRIES = 2000
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 儀表板即時更新（SSE）每個程序的同時連線上限，每條連線佔用一個執行緒
+SSE_MAX_SUBSCRIBERS = 500
+
+# 正式環境（flask --app app serve，需 gunicorn）；SERVE_WORKERS 預設為 CPU 核心數 x 2 + 1
+SERVE_BIND = "0.0.0.0:5000"
+SERVE_THREADS = 4
+# serve 時每個 worker 最多幾成執行緒給 SSE 長連線（至少留一個處理一般請求）
+SERVE_SSE_THREADS = 0.5
+SERVE_MAX_REQUESTS = 1000
+
+# 重複收據偵測：感知雜湊漢明距離門檻（0–64，越小越嚴格）與雜湊執行緒數
+PHASH_DISTANCE = 6
+PHASH_WORKERS = 2
+
+# 顯示時間用的時區（資料庫一律存 UTC epoch 秒）
+TIMEZONE = "Asia/Taipei"
+
+# 多校區：'' 為單一資料庫；'subdomain'（<tenant>.網域）或 'path'（/<tenant>/...）
+# 新增校區：flask --app app tenant-create <名稱>，資料庫位於 TENANTS_DIR/<名稱>/fund_app.db
+TENANT_MODE = ""
+TENANT_BASE_DOMAIN = ""   # subdomain 模式的主網域（例："fund.school.edu.tw"），只有 <名稱>.主網域 會對應到校區
+TENANT_MAX_OPEN = 32
+TENANT_POOL_SIZE = 8
+
+# 上傳檔案儲存："local"（static/uploads）或 "s3"（S3 / MinIO 等相容服務，需安裝 boto3）
+# S3 需在 bucket 設定 CORS 允許本站以 POST 直傳；既有檔案可用 flask --app app storage-migrate 搬移
+STORAGE_BACKEND = "local"
+S3_BUCKET = ""
+S3_ENDPOINT_URL = ""
+UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+# 大檔分段續傳每段大小（S3 最少 5 MiB）
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# 上傳前在瀏覽器縮圖：長邊上限（像素）與 JPEG 品質；伺服器也會把超過上限的圖片縮小
+UPLOAD_IMAGE_MAX_PX = 2048
+UPLOAD_IMAGE_QUALITY = 82
+
+# 請求剖析（/admin/profiles 開關）：堆疊取樣間隔與保留筆數
+PROFILE_INTERVAL_MS = 5
+PROFILE_KEEP = 500
+
+# 模板 bytecode cache 目錄（"" 關閉）；serve 啟動時是否把每個模板試渲染一次暖機
+TEMPLATE_CACHE_DIR = ".jinja_cache"
+TEMPLATE_WARMUP_RENDER = True
+
+# 線上備份（flask --app app backup）：快照目錄、保留個數、每步複製的資料庫頁數
+BACKUP_DIR = "backups"
+BACKUP_KEEP = 14
+BACKUP_STEP_PAGES = 256
+
+# 背景維護：孤兒上傳檔清理間隔 / 保留新檔秒數、incremental vacuum 與 ANALYZE 間隔（秒，0 為不在背景執行）
+JANITOR_INTERVAL = 3600
+JANITOR_GRACE = 86400
+DB_MAINTENANCE_INTERVAL = 86400
+VACUUM_PAGES = 2000
+
+# 資料庫後端："sqlite"（fund_app.db）或 "postgres"（需安裝 psycopg2，多台主機共用；先以 flask --app app db-copy 搬移資料）
+DB_BACKEND = "sqlite"
+DATABASE_URL = ""
+
+# 流量控制：每個帳號（未登入依 IP）各類請求的 (每秒補充數, 可連續請求數)，超過回 429；
+# 匯出每個程序同時最多幾個，滿了回 503。計數存 "memory"（各 worker 自己算）或 "sqlite"（資料庫，全部 worker 共用）
+RATE_LIMIT_ENABLED = True
+RATE_LIMIT_STORE = "memory"
+RATE_LIMITS = {
+    'read': (5, 30),
+    'write': (1, 10),
+    'upload': (10, 60),
+    'export': (1 / 30, 3),
+    'login': (1 / 6, 10),   # 登入送出，依 IP + 帳號計算
+}
+# 前面有幾層反向代理（nginx 等）；0 為直接對外。設定後依 X-Forwarded-For 取得用戶端 IP（速率限制用）
+TRUSTED_PROXY_HOPS = 0
+EXPENSIVE_CONCURRENCY = 2
+
+# 期末單位結算報表（flask --app app statements）：zip 輸出目錄、平行程序數（0 為 CPU 核心數）、收據與照片縮圖邊長（px）
+STATEMENT_DIR = "statements"
+STATEMENT_WORKERS = 0
+STATEMENT_THUMB_PX = 240